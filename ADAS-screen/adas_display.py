@@ -1,27 +1,159 @@
 import sys
-from PyQt5.QtWidgets import QApplication, QWidget, QVBoxLayout, QHBoxLayout, QLabel, QStackedWidget
-from PyQt5.QtCore import Qt, QTimer
-from PyQt5.QtGui import QFont, QColor, QPalette
+import time
+import random
+import threading
+from functools import lru_cache
+from PyQt5.QtWidgets import QApplication, QWidget, QVBoxLayout, QHBoxLayout, QLabel
+from PyQt5.QtCore import Qt, QRect, QPoint, QThread, pyqtSignal
+from PyQt5.QtGui import QFont, QColor, QPalette, QPainter, QRegion
+
+COL_BG = "#1a1a1a"
+COL_FG = "#e0e0e0"
+COL_WARN_RED = "#ff0000"
+COL_WARN_ORANGE = "#ffa500"
+
+# Warning colours are resolved once through the "state" dynamic property,
+# so updates only re-polish the affected label instead of re-parsing CSS.
+STYLE_SHEET = f"""
+* {{ background-color: {COL_BG}; color: {COL_FG}; }}
+QLabel[state="warn"] {{ color: {COL_WARN_RED}; font-weight: bold; }}
+QLabel[state="alert"] {{ color: {COL_WARN_ORANGE}; font-weight: bold; }}
+"""
+
+# Fixed dashboard texts, shared by the initial labels and every update
+LDW_OK = "LDW: OK"
+LDW_WARN = "LDW: WARNING!"
+BSD_OK = "BSD: OK"
+BSD_WARN = "BSD: OBJECT!"
+LIGHT_ON = "Auto Light: ON"
+LIGHT_OFF = "Auto Light: OFF"
+
+MODES = ("dashboard", "rear_view", "navigation")
+_N_MODES = len(MODES)
+
+SIM_SPEED_RANGE = range(60, 121) # Simulated cruise control speeds, km/h
+TSR_SIGNS = ("No Sign", "Speed 50", "Stop Sign", "Yield")
+
+# Shared font registry; identical QFonts share one font engine. Built lazily
+# because fonts should not be created before the QApplication exists.
+@lru_cache(maxsize=None)
+def get_font(size, weight=QFont.Normal):
+    return QFont("Arial", size, weight)
+
+class RearViewWidget(QWidget):
+    # Paints camera frames itself. set_frame() only keeps the newest frame and
+    # calls update(), which Qt coalesces into at most one paint per event loop
+    # pass, so frames arriving faster than the screen refresh never queue up.
+    # paintEvent covers every pixel, so Qt skips the background fill beneath it.
+    def __init__(self, placeholder_text, parent=None):
+        super().__init__(parent)
+        self.placeholder_text = placeholder_text
+        self._frame = None
+        self._background = QColor(COL_BG)
+        self.setAttribute(Qt.WA_OpaquePaintEvent, True)
+        self.setAttribute(Qt.WA_NoSystemBackground, True)
+
+    def set_frame(self, image):
+        self._frame = image
+        self.update()
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        if self._frame is None:
+            painter.fillRect(self.rect(), self._background)
+            painter.drawText(self.rect(), Qt.AlignCenter, self.placeholder_text)
+            return
+        target = QRect(QPoint(0, 0), self._frame.size().scaled(self.size(), Qt.KeepAspectRatio))
+        target.moveCenter(self.rect().center())
+        # Only the letterbox bars need filling; the frame covers the rest
+        for bar in QRegion(self.rect()).subtracted(QRegion(target)).rects():
+            painter.fillRect(bar, self._background)
+        painter.drawImage(target, self._frame)
+
+class SensorWorker(QThread):
+    # Takes sensor readings off the UI thread and hands each one to the
+    # display through a queued signal, so a slow or blocking read never stalls
+    # painting or key handling. The cadence is kept against time.monotonic().
+    readings_ready = pyqtSignal(dict)
+
+    def __init__(self, interval=1.0, parent=None):
+        super().__init__(parent)
+        self.interval = interval
+        self._rng = random.Random() # Private generator for the simulated sensors
+        self._active = threading.Event() # Set while readings are wanted
+        self._wake = threading.Event() # Interrupts the wait between readings
+        self._stopped = threading.Event()
+
+    def resume(self):
+        self._active.set()
+        self._wake.set() # Take a reading right away so labels aren't stale
+
+    def pause(self):
+        self._active.clear()
+
+    def stop(self):
+        self._stopped.set()
+        self._active.set()
+        self._wake.set()
+
+    def read_sensors(self):
+        # Stand-in for the camera/CAN/sensor reads; keeps all I/O out of the
+        # label updates so a real source can be dropped in here.
+        rng = self._rng
+        return {
+            "ldw_warning": rng.random() < 0.1, # 10% chance of warning
+            "bsd_warning": rng.random() < 0.05, # 5% chance of BSD warning
+            "speed": rng.choice(SIM_SPEED_RANGE), # Cruise Control
+            "tsr": rng.randrange(len(TSR_SIGNS)), # Index into TSR_SIGNS
+            "auto_light": rng.random() < 0.5,
+        }
+
+    def run(self):
+        deadline = time.monotonic()
+        while not self._stopped.is_set():
+            if not self._active.is_set():
+                self._active.wait() # Paused
+                continue
+            if self._wake.is_set():
+                self._wake.clear()
+                deadline = time.monotonic()
+
+            delay = deadline - time.monotonic()
+            if delay > 0:
+                self._wake.wait(delay)
+                continue
+
+            self.readings_ready.emit(self.read_sensors())
+            deadline += self.interval
+            if deadline < time.monotonic():
+                deadline = time.monotonic() # Overran; don't fire a burst to catch up
 
 class ADASDisplay(QWidget):
     def __init__(self):
         super().__init__()
         self.setWindowTitle("ADAS Display")
         self.setWindowState(Qt.WindowFullScreen) # Make it full screen
-        self.setStyleSheet("background-color: #1a1a1a; color: #e0e0e0;") # Dark theme
+        self.setStyleSheet(STYLE_SHEET) # Dark theme
+
+        self._last_data = {} # Last applied sensor reading, for change detection
+
+        # Readings come from small fixed domains, so their label texts are
+        # formatted once here and looked up on every tick
+        self._speed_strs = [f"SPEED: {v} km/h" for v in SIM_SPEED_RANGE]
+        self._tsr_strs = [f"TSR: {sign}" for sign in TSR_SIGNS]
 
-        self.stacked_widget = QStackedWidget()
         self.init_ui()
 
+        # Simulate data updates on a background thread; only runs while the
+        # dashboard is shown
+        self.sensor_worker = SensorWorker(interval=1.0, parent=self) # Update every 1 second
+        self.sensor_worker.readings_ready.connect(self.apply_sensor_data, Qt.QueuedConnection)
+        self.sensor_worker.start()
+
         self.current_mode_index = 0
-        self.modes = ["dashboard", "rear_view", "navigation"]
+        self.modes = MODES
         self.update_display_mode()
 
-        # Simulate data updates
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.update_simulated_data)
-        self.timer.start(1000) # Update every 1 second
-
     def init_ui(self):
         main_layout = QVBoxLayout()
         main_layout.setContentsMargins(0, 0, 0, 0)
@@ -35,10 +167,10 @@ class ADASDisplay(QWidget):
 
         # Top section: Critical Warnings (LDW, BSD)
         top_warning_layout = QHBoxLayout()
-        self.ldw_label = QLabel("LDW: OK")
-        self.bsd_label = QLabel("BSD: OK")
-        self.ldw_label.setFont(QFont("Arial", 24, QFont.Bold))
-        self.bsd_label.setFont(QFont("Arial", 24, QFont.Bold))
+        self.ldw_label = QLabel(LDW_OK)
+        self.bsd_label = QLabel(BSD_OK)
+        self.ldw_label.setFont(get_font(24, QFont.Bold))
+        self.bsd_label.setFont(get_font(24, QFont.Bold))
         self.ldw_label.setAlignment(Qt.AlignCenter)
         self.bsd_label.setAlignment(Qt.AlignCenter)
         top_warning_layout.addWidget(self.ldw_label)
@@ -47,94 +179,126 @@ class ADASDisplay(QWidget):
 
         # Middle section: Speed (Cruise Control)
         self.speed_label = QLabel("SPEED: 0 km/h")
-        self.speed_label.setFont(QFont("Arial", 72, QFont.Bold))
+        self.speed_label.setFont(get_font(72, QFont.Bold))
         self.speed_label.setAlignment(Qt.AlignCenter)
+        self._speed_fm = self.speed_label.fontMetrics()
         dashboard_layout.addWidget(self.speed_label)
 
         # Bottom section: TSR, Auto Light
         bottom_info_layout = QHBoxLayout()
         self.tsr_label = QLabel("TSR: No Sign")
-        self.auto_light_label = QLabel("Auto Light: OFF")
-        self.tsr_label.setFont(QFont("Arial", 24))
-        self.auto_light_label.setFont(QFont("Arial", 24))
+        self.auto_light_label = QLabel(LIGHT_OFF)
+        self.tsr_label.setFont(get_font(24))
+        self.auto_light_label.setFont(get_font(24))
         self.tsr_label.setAlignment(Qt.AlignCenter)
         self.auto_light_label.setAlignment(Qt.AlignCenter)
+        self._tsr_fm = self.tsr_label.fontMetrics()
         bottom_info_layout.addWidget(self.tsr_label)
         bottom_info_layout.addWidget(self.auto_light_label)
         dashboard_layout.addLayout(bottom_info_layout)
 
+        # Reserve room for the widest text each changing label can show so new
+        # readings never resize it and shift its neighbours
+        self.speed_label.setMinimumWidth(max(map(self._speed_fm.horizontalAdvance, self._speed_strs)))
+        self.tsr_label.setMinimumWidth(max(map(self._tsr_fm.horizontalAdvance, self._tsr_strs)))
+
         self.dashboard_page.setLayout(dashboard_layout)
-        self.stacked_widget.addWidget(self.dashboard_page) # Index 0
+        main_layout.addWidget(self.dashboard_page) # Index 0
 
         # --- Rear View Camera Mode ---
         self.rear_view_page = QWidget()
         rear_view_layout = QVBoxLayout()
-        self.rear_view_label = QLabel("REAR VIEW CAMERA FEED")
-        self.rear_view_label.setFont(QFont("Arial", 48, QFont.Bold))
-        self.rear_view_label.setAlignment(Qt.AlignCenter)
-        rear_view_layout.addWidget(self.rear_view_label)
+        self.rear_view_widget = RearViewWidget("REAR VIEW CAMERA FEED")
+        self.rear_view_widget.setFont(get_font(48, QFont.Bold))
+        rear_view_layout.addWidget(self.rear_view_widget)
         self.rear_view_page.setLayout(rear_view_layout)
-        self.stacked_widget.addWidget(self.rear_view_page) # Index 1
+        main_layout.addWidget(self.rear_view_page) # Index 1
 
         # --- Navigation Mode ---
         self.navigation_page = QWidget()
         navigation_layout = QVBoxLayout()
         self.navigation_label = QLabel("RACE NAVIGATION MAP")
-        self.navigation_label.setFont(QFont("Arial", 48, QFont.Bold))
+        self.navigation_label.setFont(get_font(48, QFont.Bold))
         self.navigation_label.setAlignment(Qt.AlignCenter)
         self.lap_counter_label = QLabel("LAP: 0/0")
-        self.lap_counter_label.setFont(QFont("Arial", 36))
+        self.lap_counter_label.setFont(get_font(36))
         self.lap_counter_label.setAlignment(Qt.AlignCenter)
         navigation_layout.addWidget(self.navigation_label)
         navigation_layout.addWidget(self.lap_counter_label)
         self.navigation_page.setLayout(navigation_layout)
-        self.stacked_widget.addWidget(self.navigation_page) # Index 2
+        main_layout.addWidget(self.navigation_page) # Index 2
 
-        main_layout.addWidget(self.stacked_widget)
+        # All pages share the full-screen layout; only the current one is
+        # visible, so switching modes is a single hide/show pair
+        self._pages = (self.dashboard_page, self.rear_view_page, self.navigation_page)
         self.setLayout(main_layout)
 
     def update_display_mode(self):
-        self.stacked_widget.setCurrentIndex(self.current_mode_index)
+        for index, page in enumerate(self._pages):
+            page.setVisible(index == self.current_mode_index)
+        if self.current_mode_index == 0:
+            self.sensor_worker.resume()
+        else:
+            self.sensor_worker.pause()
 
     def keyPressEvent(self, event):
+        if event.isAutoRepeat(): # A held key switches mode once, not ~30 times a second
+            return
         if event.key() == Qt.Key_Right: # Simulate "Forward" button
-            self.current_mode_index = (self.current_mode_index + 1) % len(self.modes)
+            self.current_mode_index = (self.current_mode_index + 1) % _N_MODES
             self.update_display_mode()
         elif event.key() == Qt.Key_Left: # Simulate "Backward" button
-            self.current_mode_index = (self.current_mode_index - 1 + len(self.modes)) % len(self.modes)
+            self.current_mode_index = (self.current_mode_index - 1) % _N_MODES
             self.update_display_mode()
         elif event.key() == Qt.Key_Q: # Quit
             self.close()
 
-    def update_simulated_data(self):
-        # Simulate LDW/BSD warnings
-        if self.current_mode_index == 0: # Only update dashboard elements in dashboard mode
-            import random
-            if random.random() < 0.1: # 10% chance of warning
-                self.ldw_label.setText("LDW: WARNING!")
-                self.ldw_label.setStyleSheet("color: red; font-weight: bold;")
-            else:
-                self.ldw_label.setText("LDW: OK")
-                self.ldw_label.setStyleSheet("color: #e0e0e0;")
-
-            if random.random() < 0.05: # 5% chance of BSD warning
-                self.bsd_label.setText("BSD: OBJECT!")
-                self.bsd_label.setStyleSheet("color: orange; font-weight: bold;")
-            else:
-                self.bsd_label.setText("BSD: OK")
-                self.bsd_label.setStyleSheet("color: #e0e0e0;")
-
-            # Simulate speed (Cruise Control)
-            current_speed = random.randint(60, 120)
-            self.speed_label.setText(f"SPEED: {current_speed} km/h")
-
-            # Simulate TSR
-            signs = ["No Sign", "Speed 50", "Stop Sign", "Yield"]
-            self.tsr_label.setText(f"TSR: {random.choice(signs)}")
-
-            # Simulate Auto Light
-            light_status = "ON" if random.random() < 0.5 else "OFF"
-            self.auto_light_label.setText(f"Auto Light: {light_status}")
+    def closeEvent(self, event):
+        self.sensor_worker.stop()
+        self.sensor_worker.wait()
+        super().closeEvent(event)
+
+    def set_label_state(self, label, state):
+        if label.property("state") == state:
+            return
+        label.setProperty("state", state)
+        label.style().unpolish(label)
+        label.style().polish(label)
+
+    def apply_sensor_data(self, data):
+        changed = {key: value for key, value in data.items()
+                   if self._last_data.get(key) != value}
+        if not changed:
+            return
+        self._last_data = data
+
+        # Suspend painting so all label changes land in a single repaint
+        self.dashboard_page.setUpdatesEnabled(False)
+        try:
+            if "ldw_warning" in changed:
+                if data["ldw_warning"]:
+                    self.ldw_label.setText(LDW_WARN)
+                    self.set_label_state(self.ldw_label, "warn")
+                else:
+                    self.ldw_label.setText(LDW_OK)
+                    self.set_label_state(self.ldw_label, "ok")
+
+            if "bsd_warning" in changed:
+                if data["bsd_warning"]:
+                    self.bsd_label.setText(BSD_WARN)
+                    self.set_label_state(self.bsd_label, "alert")
+                else:
+                    self.bsd_label.setText(BSD_OK)
+                    self.set_label_state(self.bsd_label, "ok")
+
+            if "speed" in changed:
+                self.speed_label.setText(self._speed_strs[data["speed"] - SIM_SPEED_RANGE.start])
+            if "tsr" in changed:
+                self.tsr_label.setText(self._tsr_strs[data["tsr"]])
+            if "auto_light" in changed:
+                self.auto_light_label.setText(LIGHT_ON if data["auto_light"] else LIGHT_OFF)
+        finally:
+            self.dashboard_page.setUpdatesEnabled(True) # Schedules one repaint
 
 if __name__ == "__main__":
     app = QApplication(sys.argv)
@@ -57,35 +57,45 @@ def process_images(input_dir, output_file, model_path=None, confidence=0.3):
     
     return True
 
-def main():
-    parser = argparse.ArgumentParser(description='Batch process traffic sign detection')
-    parser.add_argument('input_dir', help='Directory containing images to process')
-    parser.add_argument('-o', '--output', default='output/batch_results.json',
-                       help='Output JSON file path (default: output/batch_results.json)')
-    parser.add_argument('-m', '--model', help='Path to TensorFlow Lite model')
-    parser.add_argument('-c', '--confidence', type=float, default=0.3,
-                       help='Confidence threshold (default: 0.3)')
-    
-    args = parser.parse_args()
+def run(input_dir, output_file='output/batch_results.json', model_path=None, confidence=0.3):
+    """
+    Run batch detection with already parsed options
     
+    Returns:
+        Process exit code (0 on success)
+    """
     print("🚀 GTSRB Traffic Sign Detection - Batch Processing")
-    print(f"📁 Input directory: {args.input_dir}")
-    print(f"📄 Output file: {args.output}")
-    print(f"🎯 Confidence threshold: {args.confidence}")
+    print(f"📁 Input directory: {input_dir}")
+    print(f"📄 Output file: {output_file}")
+    print(f"🎯 Confidence threshold: {confidence}")
     
-    if args.model:
-        print(f"🤖 Model: {args.model}")
+    if model_path:
+        print(f"🤖 Model: {model_path}")
     
     print("-" * 50)
     
-    success = process_images(args.input_dir, args.output, args.model, args.confidence)
+    success = process_images(input_dir, output_file, model_path, confidence)
     
     if success:
         print(f"\n✅ Batch processing completed successfully!")
-        print(f"📊 Results saved to: {args.output}")
+        print(f"📊 Results saved to: {output_file}")
+        return 0
     else:
         print(f"\n❌ Batch processing failed!")
-        sys.exit(1)
+        return 1
+
+def main():
+    parser = argparse.ArgumentParser(description='Batch process traffic sign detection')
+    parser.add_argument('input_dir', help='Directory containing images to process')
+    parser.add_argument('-o', '--output', default='output/batch_results.json',
+                       help='Output JSON file path (default: output/batch_results.json)')
+    parser.add_argument('-m', '--model', help='Path to TensorFlow Lite model')
+    parser.add_argument('-c', '--confidence', type=float, default=0.3,
+                       help='Confidence threshold (default: 0.3)')
+    
+    args = parser.parse_args()
+    
+    return run(args.input_dir, args.output, args.model, args.confidence)
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
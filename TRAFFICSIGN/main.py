@@ -8,15 +8,11 @@ Main script that provides a simple interface to all CORE functionality.
 
 import sys
 import os
-import argparse
+import re
 
-def main():
-    """Main entry point with command routing"""
-    
-    parser = argparse.ArgumentParser(
-        description='GTSRB Traffic Sign Detection - CORE Module',
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
+RESOLUTION_PATTERN = re.compile(r'(\d+)x(\d+)')
+
+EXAMPLES = """
 Examples:
   python main.py test                    # Run tests
   python main.py demo                    # Run interactive demo
@@ -25,113 +21,128 @@ Examples:
   python main.py pi-camera              # Run Pi camera detection
   python main.py pi-camera -c 0.4 -i 0.5 # High-frequency Pi detection
   python main.py usage                  # Show usage guide
-        """
+"""
+
+def _command_parser(command, description):
+    """Build the argument parser for a single command"""
+    # argparse is only imported by commands that take options
+    import argparse
+    return argparse.ArgumentParser(prog=f'main.py {command}', description=description)
+
+def _run_test(argv):
+    import test_core
+    return test_core.main()
+
+def _run_demo(argv):
+    import demo
+    return demo.main()
+
+def _run_detect(argv):
+    parser = _command_parser('detect', 'Detect single image')
+    parser.add_argument('image', help='Path to image file')
+    parser.add_argument('-o', '--output', help='Output JSON file')
+    parser.add_argument('-c', '--confidence', type=float, default=0.3,
+                        help='Confidence threshold (default: 0.3)')
+    args = parser.parse_args(argv)
+    
+    # Validate before the import below pulls in TensorFlow
+    if not os.path.isfile(args.image):
+        parser.error(f"Image file does not exist: {args.image}")
+    
+    import single_detect
+    return single_detect.run(args.image, output_file=args.output, confidence=args.confidence)
+
+def _run_batch(argv):
+    parser = _command_parser('batch', 'Batch process directory')
+    parser.add_argument('directory', help='Directory containing images')
+    parser.add_argument('-o', '--output', default='output/batch_results.json',
+                        help='Output JSON file (default: output/batch_results.json)')
+    parser.add_argument('-c', '--confidence', type=float, default=0.3,
+                        help='Confidence threshold (default: 0.3)')
+    args = parser.parse_args(argv)
+    
+    # Validate before the import below pulls in TensorFlow
+    if not os.path.isdir(args.directory):
+        parser.error(f"Input directory does not exist: {args.directory}")
+    
+    import batch_detect
+    return batch_detect.run(args.directory, output_file=args.output, confidence=args.confidence)
+
+def _run_usage(argv):
+    import usage
+    return usage.main()
+
+def _run_pi_camera(argv):
+    parser = _command_parser('pi-camera', 'Run Raspberry Pi camera detection')
+    parser.add_argument('-c', '--confidence', type=float, default=0.3,
+                        help='Confidence threshold (default: 0.3)')
+    parser.add_argument('-r', '--resolution', default='1920x1080',
+                        help='Camera resolution WxH (default: 1920x1080)')
+    parser.add_argument('-i', '--interval', type=float, default=1.0,
+                        help='Detection interval in seconds (default: 1.0)')
+    parser.add_argument('-d', '--duration', type=float,
+                        help='Detection duration in seconds (optional)')
+    parser.add_argument('--no-save', action='store_true',
+                        help='Do not save results to file')
+    args = parser.parse_args(argv)
+    
+    # Parse resolution before importing the detector (TensorFlow, camera stack)
+    match = RESOLUTION_PATTERN.fullmatch(args.resolution)
+    if not match:
+        parser.error("Invalid resolution format. Use WxH (e.g., 1920x1080)")
+    width, height = int(match.group(1)), int(match.group(2))
+    
+    import pi_camera_detector
+    return pi_camera_detector.run(
+        confidence=args.confidence,
+        resolution=(width, height),
+        interval=args.interval,
+        duration=args.duration,
+        save_results=not args.no_save
     )
+
+# Command name -> (handler, help text). Each handler parses only its own options.
+COMMANDS = {
+    'test': (_run_test, 'Run module tests'),
+    'demo': (_run_demo, 'Run interactive demo'),
+    'detect': (_run_detect, 'Detect single image'),
+    'batch': (_run_batch, 'Batch process directory'),
+    'usage': (_run_usage, 'Show usage guide'),
+    'pi-camera': (_run_pi_camera, 'Run Raspberry Pi camera detection'),
+}
+
+def print_help():
+    """Print the command overview"""
+    print("usage: main.py {" + ",".join(COMMANDS) + "} ...")
+    print()
+    print("GTSRB Traffic Sign Detection - CORE Module")
+    print()
+    print("Available commands:")
+    for name, (_, help_text) in COMMANDS.items():
+        print(f"  {name:<12}{help_text}")
+    print(EXAMPLES)
+
+def main():
+    """Main entry point with command routing"""
     
-    subparsers = parser.add_subparsers(dest='command', help='Available commands')
-    
-    # Test command
-    test_parser = subparsers.add_parser('test', help='Run module tests')
-    
-    # Demo command
-    demo_parser = subparsers.add_parser('demo', help='Run interactive demo')
-    
-    # Single detection command
-    detect_parser = subparsers.add_parser('detect', help='Detect single image')
-    detect_parser.add_argument('image', help='Path to image file')
-    detect_parser.add_argument('-o', '--output', help='Output JSON file')
-    detect_parser.add_argument('-c', '--confidence', type=float, default=0.3,
-                              help='Confidence threshold (default: 0.3)')
-    
-    # Batch processing command
-    batch_parser = subparsers.add_parser('batch', help='Batch process directory')
-    batch_parser.add_argument('directory', help='Directory containing images')
-    batch_parser.add_argument('-o', '--output', default='output/batch_results.json',
-                             help='Output JSON file (default: output/batch_results.json)')
-    batch_parser.add_argument('-c', '--confidence', type=float, default=0.3,
-                             help='Confidence threshold (default: 0.3)')
-    
-    # Usage command
-    usage_parser = subparsers.add_parser('usage', help='Show usage guide')
-    
-    # Pi Camera command
-    pi_parser = subparsers.add_parser('pi-camera', help='Run Raspberry Pi camera detection')
-    pi_parser.add_argument('-c', '--confidence', type=float, default=0.3,
-                          help='Confidence threshold (default: 0.3)')
-    pi_parser.add_argument('-r', '--resolution', default='1920x1080',
-                          help='Camera resolution WxH (default: 1920x1080)')
-    pi_parser.add_argument('-i', '--interval', type=float, default=1.0,
-                          help='Detection interval in seconds (default: 1.0)')
-    pi_parser.add_argument('-d', '--duration', type=float,
-                          help='Detection duration in seconds (optional)')
-    pi_parser.add_argument('--no-save', action='store_true',
-                          help='Do not save results to file')
-    
-    args = parser.parse_args()
-    
-    if not args.command:
-        parser.print_help()
+    if len(sys.argv) < 2:
+        print_help()
         return 1
     
-    # Route to appropriate script
-    if args.command == 'test':
-        import test_core
-        return test_core.main()
-    
-    elif args.command == 'demo':
-        import demo
-        return demo.main()
-    
-    elif args.command == 'detect':
-        import single_detect
-        
-        # Prepare arguments for single_detect
-        sys.argv = ['single_detect.py', args.image]
-        if args.output:
-            sys.argv.extend(['-o', args.output])
-        if args.confidence != 0.3:
-            sys.argv.extend(['-c', str(args.confidence)])
-        
-        return single_detect.main()
-    
-    elif args.command == 'batch':
-        import batch_detect
-        
-        # Prepare arguments for batch_detect
-        sys.argv = ['batch_detect.py', args.directory]
-        if args.output != 'output/batch_results.json':
-            sys.argv.extend(['-o', args.output])
-        if args.confidence != 0.3:
-            sys.argv.extend(['-c', str(args.confidence)])
-        
-        return batch_detect.main()
+    command = sys.argv[1]
+    if command in ('-h', '--help'):
+        print_help()
+        return 0
     
-    elif args.command == 'usage':
-        import usage
-        return usage.main()
-    
-    elif args.command == 'pi-camera':
-        import pi_camera_detector
-        
-        # Prepare arguments for pi_camera_detector
-        sys.argv = ['pi_camera_detector.py']
-        if args.confidence != 0.3:
-            sys.argv.extend(['--confidence', str(args.confidence)])
-        if args.resolution != '1920x1080':
-            sys.argv.extend(['--resolution', args.resolution])
-        if args.interval != 1.0:
-            sys.argv.extend(['--interval', str(args.interval)])
-        if args.duration:
-            sys.argv.extend(['--duration', str(args.duration)])
-        if args.no_save:
-            sys.argv.append('--no-save')
-        
-        return pi_camera_detector.main()
-    
-    else:
-        print(f"Unknown command: {args.command}")
-        parser.print_help()
+    # Route to appropriate script
+    entry = COMMANDS.get(command)
+    if entry is None:
+        print(f"Unknown command: {command}")
+        print_help()
         return 1
+    
+    handler, _ = entry
+    return handler(sys.argv[2:])
 
 if __name__ == "__main__":
     sys.exit(main())
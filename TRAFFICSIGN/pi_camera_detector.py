@@ -7,21 +7,29 @@ This module provides real-time traffic sign detection using Raspberry Pi Camera
 with fisheye lens support and continuous monitoring capabilities.
 """
 
-import tensorflow as tf
 import numpy as np
-from PIL import Image
+import cv2
 import json
 import os
+import sys
 import time
 from datetime import datetime
-from typing import Dict, List, Tuple, Optional
+from typing import Dict, Tuple, Optional
 import logging
 import io
 import threading
-from queue import Queue
+from queue import Queue, Empty, Full
 
+# The standalone TensorFlow Lite runtime is much lighter to install and import
+# than full TensorFlow; fall back to TensorFlow's bundled interpreter
 try:
-    from picamera2 import Picamera2
+    from tflite_runtime.interpreter import Interpreter
+except ImportError:
+    import tensorflow as tf
+    Interpreter = tf.lite.Interpreter
+
+try:
+    from picamera2 import Picamera2, MappedArray
     from libcamera import controls
     PICAMERA_AVAILABLE = True
 except ImportError:
@@ -36,7 +44,7 @@ class PiCameraTrafficSignDetector:
     """Raspberry Pi Camera traffic sign detection class with fisheye lens support"""
     
     # GTSRB class labels
-    LABELS = [
+    LABELS = (
         'Speed limit (20km/h)', 'Speed limit (30km/h)', 'Speed limit (50km/h)', 'Speed limit (60km/h)',
         'Speed limit (70km/h)', 'Speed limit (80km/h)', 'End of speed limit (80km/h)', 'Speed limit (100km/h)',
         'Speed limit (120km/h)', 'No passing', 'No passing veh over 3.5 tons', 'Right-of-way at intersection',
@@ -47,12 +55,29 @@ class PiCameraTrafficSignDetector:
         'End speed + passing limits', 'Turn right ahead', 'Turn left ahead', 'Ahead only', 'Go straight or right',
         'Go straight or left', 'Keep right', 'Keep left', 'Roundabout mandatory', 'End of no passing',
         'End no passing veh > 3.5 tons'
-    ]
+    )
+    
+    # Entries each continuous-detection pipeline queue may hold. Kept small so
+    # results stay close to real time: when a stage falls behind, the oldest
+    # frame is dropped instead of queueing up latency.
+    PIPELINE_DEPTH = 2
+    
+    # Fixed attribute set: no per-instance __dict__ and faster attribute
+    # access on the per-frame path
+    __slots__ = (
+        'model_path', 'confidence_threshold', 'camera_resolution', 'detection_resolution',
+        'detection_interval', 'num_threads', 'interpreter', 'input_details', 'output_details',
+        'camera', 'running', '_stop_event',
+        '_input_dtype', '_input_zero_point', '_output_scale', '_output_zero_point', '_inv255',
+        '_in_idx', '_out_idx', '_get_in', '_get_out', '_labels',
+        '_rgb', '_resize_u8', '_input_buf',
+    )
     
     def __init__(self, model_path: str = 'models/gtsrb_model.lite', 
                  confidence_threshold: float = 0.3,
                  camera_resolution: Tuple[int, int] = (1920, 1080),
-                 detection_interval: float = 1.0):
+                 detection_interval: float = 1.0,
+                 num_threads: Optional[int] = None):
         """
         Initialize the Raspberry Pi camera traffic sign detector
         
@@ -61,22 +86,37 @@ class PiCameraTrafficSignDetector:
             confidence_threshold: Minimum confidence threshold for detections
             camera_resolution: Camera resolution (width, height)
             detection_interval: Time interval between detections in seconds
+            num_threads: Interpreter threads (default: all CPU cores)
         """
         self.model_path = model_path
         self.confidence_threshold = confidence_threshold
         self.camera_resolution = camera_resolution
+        self.detection_resolution = None
         self.detection_interval = detection_interval
+        self.num_threads = num_threads or max(1, os.cpu_count() or 4)
         
         self.interpreter = None
         self.input_details = None
         self.output_details = None
         self.camera = None
         
-        self.detection_queue = Queue()
         self.running = False
+        self._stop_event = threading.Event()
+        
+        # Input/output handling, filled in from the model by _load_model()
+        self._input_dtype = np.dtype(np.float32)
+        self._input_zero_point = 0
+        self._output_scale = 0.0
+        self._output_zero_point = 0
+        self._inv255 = np.float32(1 / 255.0)
         
         # Initialize components
         self._load_model()
+        
+        # Preprocessing buffers, reused for every frame; the RGB conversion
+        # buffer is sized from the first camera frame
+        self._rgb = None
+        self._allocate_buffers(self._model_input_size())
         if PICAMERA_AVAILABLE:
             self._setup_camera()
         else:
@@ -86,14 +126,38 @@ class PiCameraTrafficSignDetector:
         """Load the TensorFlow Lite model"""
         try:
             logger.info(f"Loading TensorFlow Lite model: {self.model_path}")
-            self.interpreter = tf.lite.Interpreter(model_path=self.model_path)
+            # Float models run on the multi-threaded XNNPACK kernels (NEON on arm64)
+            self.interpreter = Interpreter(model_path=self.model_path, num_threads=self.num_threads)
             self.interpreter.allocate_tensors()
             
             # Get input and output details
             self.input_details = self.interpreter.get_input_details()
             self.output_details = self.interpreter.get_output_details()
             
-            logger.info(f"✅ Model loaded successfully")
+            # Integer-quantized models (see quantize_model.py) take uint8 pixels
+            # directly (int8 ones shifted by the input zero point) and return
+            # quantized scores that must be dequantized. The input tensor is
+            # written through a view, which would cast anything else silently.
+            self._input_dtype = np.dtype(self.input_details[0]['dtype'])
+            if self._input_dtype not in (np.float32, np.uint8, np.int8):
+                raise ValueError(f"Unsupported model input type: {self._input_dtype} "
+                                 f"(expected float32, uint8 or int8)")
+            self._input_zero_point = int(self.input_details[0]['quantization'][1])
+            self._output_scale, self._output_zero_point = self.output_details[0]['quantization']
+            
+            # Cache tensor indices and accessors for the per-frame path. The
+            # accessors return numpy views of the interpreter's own buffers;
+            # such views must not be held across invoke(), so only the
+            # accessor functions are stored.
+            self._in_idx = self.input_details[0]['index']
+            self._out_idx = self.output_details[0]['index']
+            self._get_in = self.interpreter.tensor(self._in_idx)
+            self._get_out = self.interpreter.tensor(self._out_idx)
+            
+            # Labels for the model's output classes, bound on the instance
+            self._labels = self.LABELS
+            
+            logger.info(f"✅ Model loaded successfully ({self.num_threads} threads)")
             logger.info(f"📐 Input shape: {self.input_details[0]['shape']}")
             logger.info(f"📊 Output shape: {self.output_details[0]['shape']}")
             
@@ -107,9 +171,18 @@ class PiCameraTrafficSignDetector:
             logger.info("🎥 Setting up Raspberry Pi camera...")
             self.camera = Picamera2()
             
+            # Detection reads the small lores stream; the ISP scales it down
+            # from the full-resolution main stream at no CPU cost
+            self.detection_resolution = self._detection_stream_size()
+            
             # Configure camera for fisheye lens (wider field of view)
+            # Frames are read in place from the camera's buffers (see
+            # _preprocess_request), so keep enough buffers for the frames
+            # queued and in flight in the detection pipeline
             config = self.camera.create_still_configuration(
                 main={"size": self.camera_resolution, "format": "RGB888"},
+                lores={"size": self.detection_resolution, "format": "YUV420"},
+                buffer_count=self.PIPELINE_DEPTH + 2,
                 controls={
                     "AwbEnable": True,  # Auto white balance
                     "AeEnable": True,   # Auto exposure
@@ -124,6 +197,7 @@ class PiCameraTrafficSignDetector:
             time.sleep(2)
             
             logger.info(f"✅ Camera initialized with resolution: {self.camera_resolution}")
+            logger.info(f"🔍 Detection stream resolution: {self.detection_resolution}")
             logger.info("🐟 Fisheye lens optimizations applied")
             
         except Exception as e:
@@ -131,50 +205,194 @@ class PiCameraTrafficSignDetector:
             self.camera = None
             raise
     
-    def preprocess_image_array(self, image_array: np.ndarray, target_size: Tuple[int, int] = (224, 224)) -> np.ndarray:
+    def _detection_stream_size(self) -> Tuple[int, int]:
+        """
+        Size of the lores detection stream (width, height)
+        
+        Keeps the camera's aspect ratio, so the image is not distorted, with
+        the short side just covering the model input.
+        """
+        width, height = self.camera_resolution
+        scale = int(self.input_details[0]['shape'][1]) / min(width, height)
+        # YUV420 needs even dimensions; lores can't be larger than main
+        return (min(width, (round(width * scale) + 1) & ~1),
+                min(height, (round(height * scale) + 1) & ~1))
+    
+    def _model_input_size(self) -> Tuple[int, int]:
+        """Input size (width, height) the model expects"""
+        input_shape = self.input_details[0]['shape']
+        return int(input_shape[2]), int(input_shape[1])
+    
+    def _allocate_buffers(self, target_size: Tuple[int, int]):
+        """Allocate the preprocessing buffers for target_size (width, height)"""
+        width, height = target_size
+        self._resize_u8 = np.empty((height, width, 3), dtype=np.uint8)
+        self._input_buf = self._new_input_buffer(target_size)
+    
+    def _new_input_buffer(self, target_size: Optional[Tuple[int, int]] = None) -> np.ndarray:
+        """Allocate a batched input buffer for target_size (default: the model input size)"""
+        width, height = target_size or self._model_input_size()
+        return np.empty((1, height, width, 3), dtype=self._input_dtype)
+    
+    def preprocess_image_array(self, image_array: np.ndarray, target_size: Optional[Tuple[int, int]] = None,
+                               out: Optional[np.ndarray] = None) -> np.ndarray:
         """
         Preprocess image array for model inference
         
         Args:
             image_array: Input image as numpy array
-            target_size: Target size for resizing (width, height)
+            target_size: Target size for resizing (width, height); defaults to the
+                model input size
+            out: Batched input buffer to fill (default: the detector's own buffer);
+                must match target_size
             
         Returns:
-            Preprocessed image array
+            Preprocessed image array with batch dimension. Without ``out`` this
+            is a buffer owned by the detector and is overwritten by the next call.
         """
         try:
-            # Convert to PIL Image
-            image = Image.fromarray(image_array)
-            
-            # Apply fisheye correction if needed (center crop to reduce distortion)
-            width, height = image.size
-            if width > height:
-                # Landscape - crop center square
-                left = (width - height) // 2
-                right = left + height
-                image = image.crop((left, 0, right, height))
-            elif height > width:
-                # Portrait - crop center square  
-                top = (height - width) // 2
-                bottom = top + width
-                image = image.crop((0, top, width, bottom))
-            
-            # Resize to target size
-            image = image.resize(target_size)
-            
-            # Convert to numpy array and normalize
-            image_array = np.array(image, dtype=np.float32)
-            image_array = image_array / 255.0  # Normalize to [0, 1]
-            
-            # Add batch dimension
-            image_array = np.expand_dims(image_array, axis=0)
-            
-            return image_array
+            # Apply fisheye correction (center crop to reduce distortion).
+            # Slicing gives a view of the frame, so nothing is copied here.
+            height, width = image_array.shape[:2]
+            if width != height:
+                side = min(width, height)
+                top = (height - side) // 2
+                left = (width - side) // 2
+                image_array = image_array[top:top + side, left:left + side]
+            
+            # Reallocate the buffers only if a different target size is requested
+            if target_size is None:
+                target_size = self._model_input_size()
+            if self._resize_u8.shape[:2] != (target_size[1], target_size[0]):
+                self._allocate_buffers(target_size)
+            if out is None:
+                out = self._input_buf
+            elif out.shape[1:3] != (target_size[1], target_size[0]):
+                # cv2.resize would silently allocate a new array instead of
+                # writing into a mismatched dst
+                raise ValueError(f"Input buffer shape {out.shape} does not match target size {target_size}")
+            
+            if self._input_dtype == np.uint8:
+                # uint8 models take the resized pixels as-is
+                cv2.resize(image_array, target_size, dst=out[0], interpolation=cv2.INTER_AREA)
+            elif self._input_dtype == np.int8:
+                # int8 models take the pixels shifted by the input zero point
+                # (-128 for inputs calibrated on [0, 1])
+                cv2.resize(image_array, target_size, dst=self._resize_u8, interpolation=cv2.INTER_AREA)
+                np.add(self._resize_u8, self._input_zero_point, out=out[0], dtype=np.int16, casting='unsafe')
+            else:
+                # Resize into the uint8 staging buffer, then normalize to [0, 1]
+                # straight into the float32 input buffer
+                cv2.resize(image_array, target_size, dst=self._resize_u8, interpolation=cv2.INTER_AREA)
+                np.multiply(self._resize_u8, self._inv255, out=out[0], dtype=np.float32)
+            
+            return out
             
         except Exception as e:
             logger.error(f"❌ Error preprocessing image: {e}")
             raise
     
+    def _preprocess_request(self, request, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Preprocess the lores frame of a camera capture request and release the request
+        
+        The frame is read straight from the camera's memory-mapped buffer, so it
+        is never copied into a Python-owned array. Only the small lores YUV420
+        frame is converted to RGB.
+        """
+        try:
+            with MappedArray(request, 'lores') as mapped:
+                # The YUV420 array is (height * 3/2, stride); drop stride padding
+                yuv = mapped.array
+                rgb_shape = (yuv.shape[0] * 2 // 3, yuv.shape[1], 3)
+                if self._rgb is None or self._rgb.shape != rgb_shape:
+                    self._rgb = np.empty(rgb_shape, dtype=np.uint8)
+                rgb = cv2.cvtColor(yuv, cv2.COLOR_YUV2RGB_I420, dst=self._rgb)
+                return self.preprocess_image_array(rgb[:, :self.detection_resolution[0]], out=out)
+        finally:
+            request.release()
+    
+    def _error_result(self, error: str) -> Dict:
+        """Build the result dictionary for a failed detection"""
+        return {
+            'timestamp_ns': time.time_ns(),
+            'error': error,
+            'detected': False
+        }
+    
+    def _run_inference(self, input_data: Optional[np.ndarray] = None) -> Tuple[np.ndarray, float]:
+        """
+        Run the model on a preprocessed input
+        
+        Args:
+            input_data: Preprocessed input; None if it was already written
+                into the interpreter's input tensor
+        
+        Returns:
+            Tuple of (class scores, inference time in seconds)
+        """
+        inference_start = time.monotonic()
+        if input_data is not None:
+            # Keep set_tensor's type check: never cast into the input tensor
+            np.copyto(self._get_in(), input_data, casting='no')
+        self.interpreter.invoke()
+        inference_time = time.monotonic() - inference_start
+        
+        # Get output; the scores must not stay a view of the interpreter's buffer
+        output_data = self._get_out()[0]
+        if self._output_scale:
+            scores = (output_data.astype(np.float32) - self._output_zero_point) * self._output_scale
+        else:
+            scores = output_data.copy()
+        
+        return scores, inference_time
+    
+    def _build_result(self, scores: np.ndarray, capture_time: float,
+                      preprocess_time: float, inference_time: float) -> Dict:
+        """Build the detection result dictionary from the model's class scores"""
+        # Get top 3 predictions: partition out the top k, then sort only those
+        k = 3
+        top_indices = np.argpartition(scores, -k)[-k:]
+        top_indices = top_indices[np.argsort(scores[top_indices])[::-1]]
+        
+        # Get predictions (the best of the top k)
+        labels = self._labels
+        threshold = self.confidence_threshold
+        predicted_class = int(top_indices[0])
+        confidence = float(scores[predicted_class])
+        detected = confidence > threshold
+        
+        # Only build entries for the predictions above the threshold
+        top_scores = scores[top_indices]
+        mask = top_scores > threshold
+        top_predictions = [
+            {'class_id': idx, 'label': labels[idx], 'confidence': score}
+            for idx, score in zip(top_indices[mask].tolist(), top_scores[mask].tolist())
+        ]
+        
+        # Prepare result
+        return {
+            'timestamp_ns': time.time_ns(),
+            'capture_time_ms': round(capture_time * 1000, 2),
+            'preprocess_time_ms': round(preprocess_time * 1000, 2),
+            'inference_time_ms': round(inference_time * 1000, 2),
+            'total_time_ms': round((capture_time + preprocess_time + inference_time) * 1000, 2),
+            'detected': detected,
+            'camera_resolution': self.camera_resolution,
+            'primary_detection': {
+                'class_id': predicted_class,
+                'label': labels[predicted_class],
+                'confidence': confidence
+            } if detected else None,
+            'top_predictions': top_predictions,
+            'model_info': {
+                'model_path': self.model_path,
+                'confidence_threshold': threshold,
+                'input_shape': self.input_details[0]['shape'].tolist(),
+                'total_classes': len(labels)
+            }
+        }
+    
     def capture_and_detect(self) -> Dict:
         """
         Capture image from camera and detect traffic signs
@@ -183,97 +401,145 @@ class PiCameraTrafficSignDetector:
             Detection results dictionary
         """
         if not self.camera:
-            return {
-                'timestamp': datetime.now().isoformat(),
-                'error': 'Camera not available',
-                'detected': False
-            }
+            return self._error_result('Camera not available')
         
         try:
             # Capture image
-            capture_start = time.time()
-            image_array = self.camera.capture_array()
-            capture_time = time.time() - capture_start
+            capture_start = time.monotonic()
+            request = self.camera.capture_request()
+            capture_time = time.monotonic() - capture_start
             
-            # Preprocess image
-            preprocess_start = time.time()
-            input_data = self.preprocess_image_array(image_array)
-            preprocess_time = time.time() - preprocess_start
+            # Preprocess image straight into the interpreter's input tensor
+            preprocess_start = time.monotonic()
+            self._preprocess_request(request, out=self._get_in())
+            preprocess_time = time.monotonic() - preprocess_start
             
             # Run inference
-            inference_start = time.time()
-            self.interpreter.set_tensor(self.input_details[0]['index'], input_data)
-            self.interpreter.invoke()
-            inference_time = time.time() - inference_start
-            
-            # Get output
-            output_data = self.interpreter.get_tensor(self.output_details[0]['index'])
-            
-            # Get predictions
-            predicted_class = np.argmax(output_data[0])
-            confidence = float(np.max(output_data[0]))
-            
-            # Get top 3 predictions
-            top_indices = np.argsort(output_data[0])[-3:][::-1]
-            top_predictions = []
-            
-            for idx in top_indices:
-                if output_data[0][idx] > self.confidence_threshold:
-                    top_predictions.append({
-                        'class_id': int(idx),
-                        'label': self.LABELS[idx],
-                        'confidence': float(output_data[0][idx])
-                    })
-            
-            # Prepare result
-            result = {
-                'timestamp': datetime.now().isoformat(),
-                'capture_time_ms': round(capture_time * 1000, 2),
-                'preprocess_time_ms': round(preprocess_time * 1000, 2),
-                'inference_time_ms': round(inference_time * 1000, 2),
-                'total_time_ms': round((capture_time + preprocess_time + inference_time) * 1000, 2),
-                'detected': confidence > self.confidence_threshold,
-                'camera_resolution': self.camera_resolution,
-                'primary_detection': {
-                    'class_id': int(predicted_class),
-                    'label': self.LABELS[predicted_class],
-                    'confidence': confidence
-                } if confidence > self.confidence_threshold else None,
-                'top_predictions': top_predictions,
-                'model_info': {
-                    'model_path': self.model_path,
-                    'confidence_threshold': self.confidence_threshold,
-                    'input_shape': self.input_details[0]['shape'].tolist(),
-                    'total_classes': len(self.LABELS)
-                }
-            }
+            scores, inference_time = self._run_inference()
             
-            return result
+            return self._build_result(scores, capture_time, preprocess_time, inference_time)
             
         except Exception as e:
             logger.error(f"❌ Error during capture and detection: {e}")
-            return {
-                'timestamp': datetime.now().isoformat(),
-                'error': str(e),
-                'detected': False
-            }
+            return self._error_result(str(e))
+    
+    @staticmethod
+    def _put_latest(queue: Queue, item, on_drop=None):
+        """Put item on a bounded queue, dropping the oldest entries while it is full"""
+        while True:
+            try:
+                queue.put_nowait(item)
+                return
+            except Full:
+                try:
+                    dropped = queue.get_nowait()
+                except Empty:
+                    continue
+                if on_drop is not None:
+                    on_drop(dropped)
+    
+    def _capture_stage(self, stop_event: threading.Event, raw_queue: Queue, result_queue: Queue):
+        """Pipeline stage: capture a frame every detection interval"""
+        # Sleep until a fixed deadline rather than for a fixed interval, so
+        # the capture time doesn't add to the cadence
+        next_tick = time.monotonic()
+        while not stop_event.is_set():
+            try:
+                capture_start = time.monotonic()
+                request = self.camera.capture_request()
+                capture_time = time.monotonic() - capture_start
+                self._put_latest(raw_queue, (request, capture_time),
+                                 on_drop=lambda dropped: dropped[0].release())
+            except Exception as e:
+                logger.error(f"❌ Error capturing image: {e}")
+                result_queue.put(self._error_result(str(e)))
+            
+            # Wait for next detection; when capture overran the interval,
+            # start over from now instead of piling up missed ticks
+            next_tick += self.detection_interval
+            sleep_for = next_tick - time.monotonic()
+            if sleep_for > 0:
+                # Wakes up early when the session is stopped
+                stop_event.wait(sleep_for)
+            else:
+                next_tick = time.monotonic()
+    
+    def _preprocess_stage(self, stop_event: threading.Event, raw_queue: Queue, input_queue: Queue,
+                          free_buffers: Queue, result_queue: Queue):
+        """Pipeline stage: turn captured frames into model inputs"""
+        while not stop_event.is_set():
+            try:
+                request, capture_time = raw_queue.get(timeout=0.1)
+            except Empty:
+                continue
+            
+            # Buffers cycle through free_buffers, so one is never refilled
+            # while the inference stage still reads it
+            buffer = free_buffers.get()
+            try:
+                preprocess_start = time.monotonic()
+                self._preprocess_request(request, out=buffer)
+                preprocess_time = time.monotonic() - preprocess_start
+            except Exception as e:
+                logger.error(f"❌ Error preprocessing frame: {e}")
+                free_buffers.put(buffer)
+                result_queue.put(self._error_result(str(e)))
+                continue
+            
+            self._put_latest(input_queue, (buffer, capture_time, preprocess_time),
+                             on_drop=lambda dropped: free_buffers.put(dropped[0]))
+    
+    def _inference_stage(self, stop_event: threading.Event, input_queue: Queue, free_buffers: Queue,
+                         result_queue: Queue):
+        """Pipeline stage: run the model and publish results to result_queue"""
+        while not stop_event.is_set():
+            try:
+                input_data, capture_time, preprocess_time = input_queue.get(timeout=0.1)
+            except Empty:
+                continue
+            
+            try:
+                scores, inference_time = self._run_inference(input_data)
+                result = self._build_result(scores, capture_time, preprocess_time, inference_time)
+            except Exception as e:
+                logger.error(f"❌ Error during inference: {e}")
+                result = self._error_result(str(e))
+            finally:
+                free_buffers.put(input_data)
+            
+            result_queue.put(result)
     
     def start_continuous_detection(self, duration: Optional[float] = None, save_results: bool = True):
         """
         Start continuous traffic sign detection
         
+        Capture, preprocessing and inference run as a three-stage pipeline
+        on their own threads, connected by small bounded queues, so the
+        throughput is set by the slowest stage rather than the sum of all
+        three. This method consumes the results from the result queue.
+        
+        Results are streamed to an NDJSON file (one detection per line) as
+        they arrive, and only running totals are kept in memory, so long
+        sessions don't grow without bound. The session summary is written
+        to a sibling _summary.json file at the end.
+        
         Args:
             duration: Detection duration in seconds (None for indefinite)
-            save_results: Whether to save results to JSON file
+            save_results: Whether to save results to JSON files
         """
         if not self.camera:
             logger.error("❌ Camera not available for continuous detection")
             return
         
         self.running = True
-        results = []
-        start_time = time.time()
+        # Per-session stop signal; stage threads of an earlier session keep
+        # their own event
+        self._stop_event = stop_event = threading.Event()
+        start_time = time.monotonic()
         detection_count = 0
+        successful_detections = 0
+        timed_detections = 0
+        time_sums = {'capture_time_ms': 0.0, 'inference_time_ms': 0.0, 'total_time_ms': 0.0}
         
         logger.info("🚀 Starting continuous traffic sign detection...")
         logger.info(f"⏱️  Detection interval: {self.detection_interval}s")
@@ -284,36 +550,77 @@ class PiCameraTrafficSignDetector:
         else:
             logger.info("⏰ Duration: Indefinite (Press Ctrl+C to stop)")
         
+        # Detections are streamed to the results log, which is only opened
+        # when the first result arrives, so an empty session leaves no files
+        log_file = None
+        if save_results:
+            output_dir = 'output'
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            output_base = f"{output_dir}/pi_camera_detection_{timestamp}"
+        
+        # At very short intervals only every 10th result is printed, so the
+        # terminal doesn't hold up the consumer loop
+        print_every = 10 if self.detection_interval < 0.05 else 1
+        
+        # Pipeline queues; the oldest entry is dropped when a stage falls behind
+        raw_queue = Queue(maxsize=self.PIPELINE_DEPTH)
+        input_queue = Queue(maxsize=self.PIPELINE_DEPTH)
+        
+        # Results of this session only; created per call so nothing left over
+        # from an earlier session is counted again
+        result_queue = Queue()
+        
+        # One input buffer per queue slot, plus one each for the preprocess
+        # and inference stages to work on
+        free_buffers = Queue()
+        for _ in range(self.PIPELINE_DEPTH + 2):
+            free_buffers.put(self._new_input_buffer())
+        
+        stages = [
+            threading.Thread(target=self._capture_stage, args=(stop_event, raw_queue, result_queue), daemon=True),
+            threading.Thread(target=self._preprocess_stage,
+                             args=(stop_event, raw_queue, input_queue, free_buffers, result_queue), daemon=True),
+            threading.Thread(target=self._inference_stage,
+                             args=(stop_event, input_queue, free_buffers, result_queue), daemon=True),
+        ]
+        for stage in stages:
+            stage.start()
+        
         try:
             while self.running:
                 # Check duration
-                if duration and (time.time() - start_time) >= duration:
+                if duration and (time.monotonic() - start_time) >= duration:
                     break
                 
-                # Perform detection
-                result = self.capture_and_detect()
-                results.append(result)
+                # Wait for the next pipeline result
+                try:
+                    result = result_queue.get(timeout=0.1)
+                except Empty:
+                    continue
                 detection_count += 1
                 
-                # Print detection result
+                # Update running totals
                 if result.get('detected', False):
-                    primary = result.get('primary_detection', {})
-                    print(f"🚦 DETECTED: {primary.get('label', 'Unknown')} "
-                          f"(Confidence: {primary.get('confidence', 0):.2f}) "
-                          f"[Detection #{detection_count}]")
-                    
-                    # Print top predictions if available
-                    top_preds = result.get('top_predictions', [])
-                    if len(top_preds) > 1:
-                        print("   📊 Top predictions:")
-                        for i, pred in enumerate(top_preds[:3]):
-                            print(f"      {i+1}. {pred['label']} ({pred['confidence']:.2f})")
-                else:
-                    print(f"⚪ No sign detected [Detection #{detection_count}] "
-                          f"(Time: {result.get('total_time_ms', 0):.1f}ms)")
+                    successful_detections += 1
+                if 'total_time_ms' in result:
+                    timed_detections += 1
+                    for key in time_sums:
+                        time_sums[key] += result[key]
                 
-                # Wait for next detection
-                time.sleep(self.detection_interval)
+                if save_results and log_file is None:
+                    try:
+                        os.makedirs(output_dir, exist_ok=True)
+                        log_file = open(f"{output_base}.ndjson", 'w', encoding='utf-8', buffering=1 << 16)
+                    except OSError as e:
+                        logger.error(f"❌ Error opening results file {output_base}.ndjson: {e}")
+                        save_results = False
+                if log_file is not None:
+                    log_file.write(json.dumps(self._with_timestamp(result), separators=(',', ':'),
+                                              ensure_ascii=False) + '\n')
+                
+                # Print detection result
+                if detection_count % print_every == 0:
+                    sys.stdout.write(self._format_result(result, detection_count))
                 
         except KeyboardInterrupt:
             logger.info("🛑 Detection stopped by user")
@@ -321,20 +628,29 @@ class PiCameraTrafficSignDetector:
             logger.error(f"❌ Error during continuous detection: {e}")
         finally:
             self.running = False
+            stop_event.set()
+            # Stages wake up on the stop event or within their 0.1s queue
+            # timeouts; only a capture in progress can hold one up
+            for stage in stages:
+                stage.join(timeout=1.0)
             
-            # Save results if requested
-            if save_results and results:
-                output_dir = 'output'
-                os.makedirs(output_dir, exist_ok=True)
-                
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                output_file = f"{output_dir}/pi_camera_detection_{timestamp}.json"
-                
-                self._save_results_to_json(results, output_file)
-                logger.info(f"📁 Results saved to: {output_file}")
+            # Hand frames that were never preprocessed back to the camera
+            while True:
+                try:
+                    raw_queue.get_nowait()[0].release()
+                except Empty:
+                    break
             
-            total_time = time.time() - start_time
-            successful_detections = sum(1 for r in results if r.get('detected', False))
+            # Close the results log and write the session summary
+            if log_file is not None:
+                log_file.close()
+                summary_file = f"{output_base}_summary.json"
+                self._save_summary_to_json(summary_file, log_file.name, detection_count,
+                                           successful_detections, timed_detections, time_sums)
+                logger.info(f"📁 Results saved to: {log_file.name}")
+                logger.info(f"📁 Summary saved to: {summary_file}")
+            
+            total_time = time.monotonic() - start_time
             
             print(f"\n📈 Detection Summary:")
             print(f"   ⏱️  Total time: {total_time:.1f}s")
@@ -342,18 +658,50 @@ class PiCameraTrafficSignDetector:
             print(f"   ✅ Successful detections: {successful_detections}")
             print(f"   📊 Success rate: {(successful_detections/detection_count*100):.1f}%" if detection_count > 0 else "   📊 Success rate: 0%")
     
-    def _save_results_to_json(self, results: List[Dict], output_path: str):
-        """Save detection results to JSON file"""
+    @staticmethod
+    def _format_result(result: Dict, detection_count: int) -> str:
+        """Format a detection result as console text, built as a single string"""
+        if not result.get('detected', False):
+            return (f"⚪ No sign detected [Detection #{detection_count}] "
+                    f"(Time: {result.get('total_time_ms', 0):.1f}ms)\n")
+        
+        primary = result.get('primary_detection', {})
+        lines = [f"🚦 DETECTED: {primary.get('label', 'Unknown')} "
+                 f"(Confidence: {primary.get('confidence', 0):.2f}) "
+                 f"[Detection #{detection_count}]"]
+        
+        # Add top predictions if available
+        top_preds = result.get('top_predictions', [])
+        if len(top_preds) > 1:
+            lines.append("   📊 Top predictions:")
+            lines.extend(f"      {i+1}. {pred['label']} ({pred['confidence']:.2f})"
+                         for i, pred in enumerate(top_preds[:3]))
+        lines.append('')
+        return '\n'.join(lines)
+    
+    @staticmethod
+    def _with_timestamp(result: Dict) -> Dict:
+        """
+        Return result with its timestamp_ns replaced by an ISO 'timestamp'
+        
+        Results only record the raw epoch time while detecting; the ISO
+        string is formatted here, when the result is written out.
+        """
+        output = dict(result)
+        timestamp_ns = output.pop('timestamp_ns', None)
+        if timestamp_ns is None:
+            return output
+        return {'timestamp': datetime.fromtimestamp(timestamp_ns / 1e9).isoformat(), **output}
+    
+    def _save_summary_to_json(self, output_path: str, detections_path: str, total_detections: int,
+                              successful_detections: int, timed_detections: int, time_sums: Dict[str, float]):
+        """Save the detection session summary to JSON file"""
         try:
-            # Create summary statistics
-            total_detections = len(results)
-            successful_detections = sum(1 for r in results if r.get('detected', False))
             failed_detections = total_detections - successful_detections
             
             # Average processing times
-            capture_times = [r.get('capture_time_ms', 0) for r in results if 'capture_time_ms' in r]
-            inference_times = [r.get('inference_time_ms', 0) for r in results if 'inference_time_ms' in r]
-            total_times = [r.get('total_time_ms', 0) for r in results if 'total_time_ms' in r]
+            def average(key):
+                return round(time_sums[key] / timed_detections, 2) if timed_detections else 0
             
             # Prepare output data
             output_data = {
@@ -362,14 +710,14 @@ class PiCameraTrafficSignDetector:
                     'successful_detections': successful_detections,
                     'failed_detections': failed_detections,
                     'success_rate': round(successful_detections / total_detections * 100, 2) if total_detections > 0 else 0,
-                    'average_capture_time_ms': round(np.mean(capture_times), 2) if capture_times else 0,
-                    'average_inference_time_ms': round(np.mean(inference_times), 2) if inference_times else 0,
-                    'average_total_time_ms': round(np.mean(total_times), 2) if total_times else 0,
+                    'average_capture_time_ms': average('capture_time_ms'),
+                    'average_inference_time_ms': average('inference_time_ms'),
+                    'average_total_time_ms': average('total_time_ms'),
                     'camera_resolution': self.camera_resolution,
                     'detection_interval_s': self.detection_interval,
                     'session_timestamp': datetime.now().isoformat()
                 },
-                'detections': results
+                'detections_file': os.path.basename(detections_path)
             }
             
             # Save to JSON file
@@ -377,11 +725,12 @@ class PiCameraTrafficSignDetector:
                 json.dump(output_data, f, indent=2, ensure_ascii=False)
             
         except Exception as e:
-            logger.error(f"❌ Error saving results to {output_path}: {e}")
+            logger.error(f"❌ Error saving summary to {output_path}: {e}")
     
     def cleanup(self):
         """Cleanup camera resources"""
         self.running = False
+        self._stop_event.set()
         if self.camera:
             try:
                 self.camera.stop()
@@ -391,6 +740,52 @@ class PiCameraTrafficSignDetector:
                 logger.error(f"❌ Error cleaning up camera: {e}")
 
 
+def run(model_path: str = 'models/gtsrb_model.lite', confidence: float = 0.3,
+        resolution: Tuple[int, int] = (1920, 1080), interval: float = 1.0,
+        duration: Optional[float] = None, save_results: bool = True):
+    """
+    Run continuous Pi camera detection with already parsed options
+    
+    Args:
+        model_path: Path to the TensorFlow Lite model
+        confidence: Confidence threshold
+        resolution: Camera resolution (width, height)
+        interval: Detection interval in seconds
+        duration: Detection duration in seconds (None for indefinite)
+        save_results: Whether to save results to JSON file
+    """
+    print("🚦 Raspberry Pi Camera Traffic Sign Detector")
+    print("=" * 50)
+    print(f"📹 Camera Resolution: {resolution[0]}x{resolution[1]}")
+    print(f"🎯 Confidence Threshold: {confidence}")
+    print(f"⏱️  Detection Interval: {interval}s")
+    print(f"🤖 Model: {model_path}")
+    print("=" * 50)
+    
+    # Initialize detector
+    detector = None
+    try:
+        detector = PiCameraTrafficSignDetector(
+            model_path=model_path,
+            confidence_threshold=confidence,
+            camera_resolution=resolution,
+            detection_interval=interval
+        )
+        
+        # Start detection
+        detector.start_continuous_detection(
+            duration=duration,
+            save_results=save_results
+        )
+        
+    except Exception as e:
+        logger.error(f"❌ Failed to initialize detector: {e}")
+    finally:
+        # Cleanup
+        if detector is not None:
+            detector.cleanup()
+
+
 def main():
     """Main function for Pi camera detection"""
     import argparse
@@ -413,37 +808,8 @@ def main():
         logger.error("❌ Invalid resolution format. Use WxH (e.g., 1920x1080)")
         return
     
-    print("🚦 Raspberry Pi Camera Traffic Sign Detector")
-    print("=" * 50)
-    print(f"📹 Camera Resolution: {resolution[0]}x{resolution[1]}")
-    print(f"🎯 Confidence Threshold: {args.confidence}")
-    print(f"⏱️  Detection Interval: {args.interval}s")
-    print(f"🤖 Model: {args.model}")
-    print("=" * 50)
-    
-    # Initialize detector
-    try:
-        detector = PiCameraTrafficSignDetector(
-            model_path=args.model,
-            confidence_threshold=args.confidence,
-            camera_resolution=resolution,
-            detection_interval=args.interval
-        )
-        
-        # Start detection
-        detector.start_continuous_detection(
-            duration=args.duration,
-            save_results=not args.no_save
-        )
-        
-    except Exception as e:
-        logger.error(f"❌ Failed to initialize detector: {e}")
-    finally:
-        # Cleanup
-        try:
-            detector.cleanup()
-        except:
-            pass
+    run(args.model, args.confidence, resolution, args.interval, args.duration,
+        save_results=not args.no_save)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+GTSRB Model Int8 Quantization
+=============================
+
+Offline script that converts the trained GTSRB model into a fully
+integer-quantized TensorFlow Lite model for faster inference on the Pi.
+
+The converter needs the original float model (SavedModel directory or Keras
+.h5/.keras file) and a handful of representative images to calibrate the
+activation ranges. Weights are quantized per-channel, which is what the
+TFLite converter does for conv layers by default.
+
+The resulting model takes uint8 pixels (0-255) as input and returns uint8
+scores; pi_camera_detector.py detects this and skips normalization and
+dequantizes the output automatically.
+"""
+
+import os
+import sys
+import argparse
+import numpy as np
+from PIL import Image
+import tensorflow as tf
+
+def load_converter(model_path):
+    """Create a TFLite converter for a SavedModel directory or Keras model file"""
+    if os.path.isdir(model_path):
+        return tf.lite.TFLiteConverter.from_saved_model(model_path)
+    model = tf.keras.models.load_model(model_path)
+    return tf.lite.TFLiteConverter.from_keras_model(model)
+
+def representative_images(images_dir, target_size=(224, 224), max_samples=100):
+    """
+    Build the representative dataset generator used for calibration
+
+    Images are preprocessed exactly like the float model expects them:
+    resized and normalized to [0, 1].
+    """
+    image_extensions = ('.png', '.jpg', '.jpeg', '.bmp', '.tiff')
+    image_paths = sorted(
+        os.path.join(images_dir, f) for f in os.listdir(images_dir)
+        if f.lower().endswith(image_extensions)
+    )[:max_samples]
+
+    if not image_paths:
+        raise ValueError(f"No image files found in {images_dir}")
+
+    def generator():
+        for image_path in image_paths:
+            image = Image.open(image_path).convert('RGB').resize(target_size)
+            image_array = np.asarray(image, dtype=np.float32) / 255.0
+            yield [image_array[np.newaxis]]
+
+    return generator, len(image_paths)
+
+def quantize_model(model_path, images_dir, output_path, target_size=(224, 224), max_samples=100):
+    """
+    Convert a float model to a full-integer (uint8 in/out) TFLite model
+
+    Args:
+        model_path: SavedModel directory or Keras model file
+        images_dir: Directory with representative images for calibration
+        output_path: Output .lite file path
+        target_size: Model input size (width, height)
+        max_samples: Maximum number of calibration images
+    """
+    converter = load_converter(model_path)
+    generator, sample_count = representative_images(images_dir, target_size, max_samples)
+    print(f"📸 Calibrating with {sample_count} images from {images_dir}")
+
+    converter.optimizations = [tf.lite.Optimize.DEFAULT]
+    converter.representative_dataset = generator
+    converter.target_spec.supported_ops = [tf.lite.OpsSet.TFLITE_BUILTINS_INT8]
+    converter.inference_input_type = tf.uint8
+    converter.inference_output_type = tf.uint8
+
+    tflite_model = converter.convert()
+
+    output_dir = os.path.dirname(output_path)
+    if output_dir:
+        os.makedirs(output_dir, exist_ok=True)
+    with open(output_path, 'wb') as f:
+        f.write(tflite_model)
+
+    print(f"💾 Quantized model saved to: {output_path} ({len(tflite_model) / 1024:.1f} KB)")
+
+def main():
+    parser = argparse.ArgumentParser(description='Quantize the GTSRB model to int8 TensorFlow Lite')
+    parser.add_argument('model', help='Float model (SavedModel directory or Keras .h5/.keras file)')
+    parser.add_argument('-i', '--images', default='test_images',
+                       help='Representative images directory (default: test_images)')
+    parser.add_argument('-o', '--output', default='models/gtsrb_model_int8.lite',
+                       help='Output model path (default: models/gtsrb_model_int8.lite)')
+    parser.add_argument('-n', '--samples', type=int, default=100,
+                       help='Maximum number of calibration images (default: 100)')
+
+    args = parser.parse_args()
+
+    print("🚀 GTSRB Traffic Sign Detection - Int8 Quantization")
+    print(f"🤖 Model: {args.model}")
+    print("-" * 50)
+
+    try:
+        quantize_model(args.model, args.images, args.output, max_samples=args.samples)
+    except Exception as e:
+        print(f"\n❌ Quantization failed: {e}")
+        return 1
+
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -71,29 +71,26 @@ def detect_single_image(image_path, output_file=None, model_path=None, confidenc
     
     return True
 
-def main():
-    parser = argparse.ArgumentParser(description='Detect traffic signs in a single image')
-    parser.add_argument('image_path', help='Path to the image file')
-    parser.add_argument('-o', '--output', help='Output JSON file path')
-    parser.add_argument('-m', '--model', help='Path to TensorFlow Lite model')
-    parser.add_argument('-c', '--confidence', type=float, default=0.3,
-                       help='Confidence threshold (default: 0.3)')
-    
-    args = parser.parse_args()
+def run(image_path, output_file=None, model_path=None, confidence=0.3):
+    """
+    Run single image detection with already parsed options
     
+    Returns:
+        Process exit code (0 on success)
+    """
     print("🚀 GTSRB Traffic Sign Detection - Single Image")
-    print(f"📸 Image: {args.image_path}")
-    print(f"🎯 Confidence threshold: {args.confidence}")
+    print(f"📸 Image: {image_path}")
+    print(f"🎯 Confidence threshold: {confidence}")
     
-    if args.model:
-        print(f"🤖 Model: {args.model}")
+    if model_path:
+        print(f"🤖 Model: {model_path}")
     
-    if args.output:
-        print(f"📄 Output: {args.output}")
+    if output_file:
+        print(f"📄 Output: {output_file}")
     
     print("-" * 50)
     
-    success = detect_single_image(args.image_path, args.output, args.model, args.confidence)
+    success = detect_single_image(image_path, output_file, model_path, confidence)
     
     if not success:
         print(f"\n❌ Detection failed!")
@@ -101,5 +98,17 @@ def main():
     
     return 0
 
+def main():
+    parser = argparse.ArgumentParser(description='Detect traffic signs in a single image')
+    parser.add_argument('image_path', help='Path to the image file')
+    parser.add_argument('-o', '--output', help='Output JSON file path')
+    parser.add_argument('-m', '--model', help='Path to TensorFlow Lite model')
+    parser.add_argument('-c', '--confidence', type=float, default=0.3,
+                       help='Confidence threshold (default: 0.3)')
+    
+    args = parser.parse_args()
+    
+    return run(args.image_path, args.output, args.model, args.confidence)
+
 if __name__ == "__main__":
     exit(main())
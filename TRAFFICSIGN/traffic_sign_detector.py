@@ -7,7 +7,6 @@ This module provides core functionality for detecting German traffic signs
 and outputting results to JSON format.
 """
 
-import tensorflow as tf
 import numpy as np
 from PIL import Image
 import json
@@ -17,6 +16,14 @@ from datetime import datetime
 from typing import Dict, List, Tuple, Optional
 import logging
 
+# The standalone TensorFlow Lite runtime is much lighter to install and import
+# than full TensorFlow; fall back to TensorFlow's bundled interpreter
+try:
+    from tflite_runtime.interpreter import Interpreter
+except ImportError:
+    import tensorflow as tf
+    Interpreter = tf.lite.Interpreter
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -51,6 +58,10 @@ class TrafficSignDetector:
         self.interpreter = None
         self.input_details = None
         self.output_details = None
+        self._input_dtype = np.dtype(np.float32)
+        self._input_zero_point = 0
+        self._output_scale = 0.0
+        self._output_zero_point = 0
         
         # Load model
         self._load_model()
@@ -59,13 +70,23 @@ class TrafficSignDetector:
         """Load the TensorFlow Lite model"""
         try:
             logger.info(f"Loading TensorFlow Lite model: {self.model_path}")
-            self.interpreter = tf.lite.Interpreter(model_path=self.model_path)
+            self.interpreter = Interpreter(model_path=self.model_path)
             self.interpreter.allocate_tensors()
             
             # Get input and output details
             self.input_details = self.interpreter.get_input_details()
             self.output_details = self.interpreter.get_output_details()
             
+            # Integer-quantized models (see quantize_model.py) take uint8 pixels
+            # directly (int8 ones shifted by the input zero point) and return
+            # quantized scores that must be dequantized
+            self._input_dtype = np.dtype(self.input_details[0]['dtype'])
+            if self._input_dtype not in (np.float32, np.uint8, np.int8):
+                raise ValueError(f"Unsupported model input type: {self._input_dtype} "
+                                 f"(expected float32, uint8 or int8)")
+            self._input_zero_point = int(self.input_details[0]['quantization'][1])
+            self._output_scale, self._output_zero_point = self.output_details[0]['quantization']
+            
             logger.info(f"Model loaded successfully")
             logger.info(f"Input shape: {self.input_details[0]['shape']}")
             logger.info(f"Output shape: {self.output_details[0]['shape']}")
@@ -90,9 +111,17 @@ class TrafficSignDetector:
             image = Image.open(image_path).convert('RGB')
             image = image.resize(target_size)
             
-            # Convert to numpy array and normalize
-            image_array = np.array(image, dtype=np.float32)
-            image_array = image_array / 255.0  # Normalize to [0, 1]
+            # Quantized models take the raw pixels, no normalization needed
+            if self._input_dtype == np.uint8:
+                return np.expand_dims(np.asarray(image, dtype=np.uint8), axis=0)
+            if self._input_dtype == np.int8:
+                image_array = (np.asarray(image, dtype=np.int16) + self._input_zero_point).astype(np.int8)
+                return np.expand_dims(image_array, axis=0)
+            
+            # Convert to numpy array and normalize to [0, 1] in place; asarray
+            # wraps the image data, so astype makes the only copy
+            image_array = np.asarray(image).astype(np.float32, copy=False)
+            np.multiply(image_array, np.float32(1 / 255.0), out=image_array)
             
             # Add batch dimension
             image_array = np.expand_dims(image_array, axis=0)
@@ -125,6 +154,8 @@ class TrafficSignDetector:
             
             # Get output
             output_data = self.interpreter.get_tensor(self.output_details[0]['index'])
+            if self._output_scale:
+                output_data = (output_data.astype(np.float32) - self._output_zero_point) * self._output_scale
             
             # Get predictions
             predicted_class = np.argmax(output_data[0])
@@ -204,14 +235,21 @@ class TrafficSignDetector:
             output_path: Path to save JSON file
         """
         try:
-            # Create summary statistics
+            # Create summary statistics in a single pass over the results
             total_detections = len(results)
-            successful_detections = sum(1 for r in results if r.get('detected', False))
+            successful_detections = 0
+            timed_detections = 0
+            inference_time_sum = 0.0
+            for r in results:
+                if r.get('detected', False):
+                    successful_detections += 1
+                if 'inference_time_ms' in r:
+                    timed_detections += 1
+                    inference_time_sum += r['inference_time_ms']
             failed_detections = total_detections - successful_detections
             
             # Average inference time
-            inference_times = [r.get('inference_time_ms', 0) for r in results if 'inference_time_ms' in r]
-            avg_inference_time = np.mean(inference_times) if inference_times else 0
+            avg_inference_time = inference_time_sum / timed_detections if timed_detections else 0
             
             # Prepare output data
             output_data = {